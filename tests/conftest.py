@@ -0,0 +1,75 @@
+"""
+Shared fixtures for the Mergington High School API tests
+"""
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI app once, on first use"""
+    from app import app as fastapi_app
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client for the FastAPI app, shared across the session
+
+    Under pytest-xdist each worker process imports its own copy of the app, so
+    the client and the activities it mutates are isolated per worker.
+    """
+    # Entering the client runs the app's lifespan once for the whole session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _fast_json(response):
+    """Decode a response body with orjson instead of the stdlib json module"""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def fast_json():
+    """Provide the orjson-backed decoder for full /activities payloads"""
+    return _fast_json
+
+
+@pytest.fixture(scope="session")
+def _baseline(app):
+    """Snapshot the initial state of the in-memory activity database once
+
+    The snapshot is kept as serialized JSON so each reset can decode a fresh copy.
+    """
+    import app as app_module
+    return orjson.dumps(app_module.activities)
+
+
+@pytest.fixture
+def reset_activities(_baseline):
+    """Reset activities to initial state before each test"""
+    import app as app_module
+    # Routes look up the module-level dict on every request, so swapping in a
+    # fresh copy is enough; the previous dict is simply dropped.
+    app_module.activities = orjson.loads(_baseline)
+    
+    yield
+
+
+@pytest.fixture
+def activities(reset_activities):
+    """The app's in-memory activity database for the current test"""
+    import app as app_module
+    return app_module.activities
+
+
+@pytest.fixture(scope="class")
+def activities_payload(client, _baseline, fast_json):
+    """Fetch GET /activities once per test class for read-only tests"""
+    import app as app_module
+    # Earlier tests may have left the activities modified
+    app_module.activities = orjson.loads(_baseline)
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return fast_json(response)